@@ -4,12 +4,15 @@ An interactive Streamlit app where two LLMs hold a conversation with each other.
 """
 
 import streamlit as st
-from llm_client import LLMClient
-from conversation import ConversationOrchestrator
-from config import Config
+from config import get_config
+from response_cache import ResponseCache
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-import json
+import hashlib
+import orjson
 import os
+import threading
 import time
 
 
@@ -21,6 +24,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Speaker colors used in message headers, matching Streamlit's color names
+SPEAKER_COLORS = {'Model A': 'blue', 'Model B': 'violet'}
+
 
 def initialize_session_state():
     """Initialize Streamlit session state variables."""
@@ -47,10 +53,33 @@ def initialize_session_state():
     
     if 'orchestrator' not in st.session_state:
         st.session_state.orchestrator = None
+    
+    if 'config_hash' not in st.session_state:
+        st.session_state.config_hash = None
+    
+    if 'orchestrator_config_hash' not in st.session_state:
+        st.session_state.orchestrator_config_hash = None
+    
+    if 'pending_turn' not in st.session_state:
+        st.session_state.pending_turn = None
+    
+    if 'md_buffer' not in st.session_state:
+        st.session_state.md_buffer = []
+    
+    if 'transcript_exports' not in st.session_state:
+        st.session_state.transcript_exports = {}
+    
+    if 'session_stamp' not in st.session_state:
+        st.session_state.session_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    if 'counts' not in st.session_state:
+        st.session_state.counts = new_counts()
 
 
 def render_sidebar():
     """Render the configuration sidebar."""
+    defaults = get_config()
+    
     st.sidebar.title("⚙️ Configuration")
     
     # Add checkbox to use same model for both personas
@@ -67,34 +96,34 @@ def render_sidebar():
     model_a_api_key = st.sidebar.text_input(
         "API Key (Model A)",
         type="password",
-        value=Config.MODEL_A_API_KEY,
+        value=defaults.model_a_api_key,
         key="model_a_api_key",
         help="Leave empty to use .env configuration"
     )
     
     model_a_base_url = st.sidebar.text_input(
         "Base URL (Model A) - Optional",
-        value=Config.MODEL_A_BASE_URL or "",
+        value=defaults.model_a_base_url or "",
         key="model_a_base_url",
         help="Leave empty to use default OpenAI endpoint or .env configuration"
     )
     
     model_a_name = st.sidebar.text_input(
         "Model Name (Model A)",
-        value=Config.MODEL_A_NAME,
+        value=defaults.model_a_name,
         key="model_a_name"
     )
     
     model_a_nickname = st.sidebar.text_input(
         "Nickname (Model A)",
-        value=Config.MODEL_A_NICKNAME,
+        value=defaults.model_a_nickname,
         key="model_a_nickname",
         help="Display name in conversation"
     )
     
     model_a_persona = st.sidebar.text_area(
         "Persona/Behavior (Model A)",
-        value=Config.MODEL_A_PERSONA,
+        value=defaults.model_a_persona,
         key="model_a_persona",
         height=100
     )
@@ -105,7 +134,7 @@ def render_sidebar():
     model_b_api_key = st.sidebar.text_input(
         "API Key (Model B)",
         type="password",
-        value=Config.MODEL_B_API_KEY if not use_same_model else Config.MODEL_A_API_KEY,
+        value=defaults.model_b_api_key if not use_same_model else defaults.model_a_api_key,
         key="model_b_api_key",
         disabled=use_same_model,
         help="Leave empty to use .env configuration"
@@ -113,7 +142,7 @@ def render_sidebar():
     
     model_b_base_url = st.sidebar.text_input(
         "Base URL (Model B) - Optional",
-        value=Config.MODEL_B_BASE_URL or "",
+        value=defaults.model_b_base_url or "",
         key="model_b_base_url",
         disabled=use_same_model,
         help="Leave empty to use default OpenAI endpoint or .env configuration"
@@ -121,21 +150,21 @@ def render_sidebar():
     
     model_b_name = st.sidebar.text_input(
         "Model Name (Model B)",
-        value=Config.MODEL_B_NAME if not use_same_model else Config.MODEL_A_NAME,
+        value=defaults.model_b_name if not use_same_model else defaults.model_a_name,
         key="model_b_name",
         disabled=use_same_model
     )
     
     model_b_nickname = st.sidebar.text_input(
         "Nickname (Model B)",
-        value=Config.MODEL_B_NICKNAME,
+        value=defaults.model_b_nickname,
         key="model_b_nickname",
         help="Display name in conversation"
     )
     
     model_b_persona = st.sidebar.text_area(
         "Persona/Behavior (Model B)",
-        value=Config.MODEL_B_PERSONA,
+        value=defaults.model_b_persona,
         key="model_b_persona",
         height=100
     )
@@ -145,7 +174,7 @@ def render_sidebar():
     
     discussion_topic = st.sidebar.text_area(
         "Discussion Topic",
-        value=Config.DISCUSSION_TOPIC,
+        value=defaults.discussion_topic,
         key="discussion_topic",
         height=80
     )
@@ -154,7 +183,7 @@ def render_sidebar():
         "Maximum Turns",
         min_value=2,
         max_value=50,
-        value=Config.MAX_TURNS,
+        value=defaults.max_turns,
         key="max_turns",
         help="Total number of exchanges (each model speaks once per turn)"
     )
@@ -163,7 +192,7 @@ def render_sidebar():
         "Temperature",
         min_value=0.0,
         max_value=2.0,
-        value=Config.TEMPERATURE,
+        value=defaults.temperature,
         step=0.1,
         key="temperature",
         help="Higher values make output more random, lower values more deterministic"
@@ -173,12 +202,23 @@ def render_sidebar():
         "Turn Delay (seconds)",
         min_value=0.0,
         max_value=5.0,
-        value=Config.TURN_DELAY,
+        value=defaults.turn_delay,
         step=0.5,
         key="turn_delay",
         help="Delay between turns to prevent rate limiting"
     )
     
+    debug_mode = st.sidebar.checkbox(
+        "Deterministic debug mode",
+        value=False,
+        key="debug_mode",
+        help="Use a fixed seed and replay cached responses for identical prompts"
+    )
+    
+    if st.sidebar.button("🗑️ Clear Response Cache", use_container_width=True, key="clear_cache_btn"):
+        _get_response_cache().clear()
+        st.sidebar.success("Response cache cleared.")
+    
     # Store configuration
     # If use_same_model is checked, copy Model A settings to Model B
     if use_same_model:
@@ -204,9 +244,17 @@ def render_sidebar():
         'discussion_topic': discussion_topic,
         'max_turns': max_turns,
         'temperature': temperature,
-        'turn_delay': turn_delay
+        'turn_delay': turn_delay,
+        'debug_mode': debug_mode
     }
     
+    # Fingerprint the settings so changes to the exported transcript can be
+    # detected cheaply
+    st.session_state.config_hash = hashlib.blake2b(
+        orjson.dumps(st.session_state.config),
+        digest_size=8
+    ).digest()
+    
     return st.session_state.config
 
 
@@ -235,21 +283,116 @@ def validate_configuration(config):
     return True, None
 
 
+# Seed used by deterministic debug mode so replays hit the response cache
+DEBUG_SEED = 42
+
+
+@st.cache_resource(show_spinner=False)
+def _get_response_cache():
+    """Get the shared on-disk response cache."""
+    return ResponseCache()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_client(api_key, base_url, model):
+    """Get a cached LLM client so restarts with unchanged settings reuse it."""
+    # Imported lazily so the page renders before the OpenAI SDK is loaded
+    from llm_client import LLMClient
+    
+    return LLMClient(
+        api_key=api_key,
+        base_url=base_url,
+        model=model,
+        response_cache=_get_response_cache()
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _get_executor():
+    """Get the shared worker pool that generates turns in the background."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def submit_turn(orchestrator, turn_number):
+    """
+    Start generating a turn on the worker pool, streaming into a buffer.
+    
+    Returns:
+        Dictionary with the turn's future, streamed chunks, cancel event and start time
+    """
+    chunks = []
+    cancel = threading.Event()
+    future = _get_executor().submit(
+        orchestrator.get_next_response,
+        turn_number,
+        on_chunk=chunks.append,
+        should_stop=cancel.is_set
+    )
+    return {'future': future, 'chunks': chunks, 'cancel': cancel, 'started': time.monotonic()}
+
+
+def discard_pending_turn():
+    """Drop any turn that is still being generated in the background."""
+    if st.session_state.pending_turn is not None:
+        st.session_state.pending_turn['cancel'].set()
+        st.session_state.pending_turn['future'].cancel()
+        st.session_state.pending_turn = None
+
+
+def wait_for_turn_delay(started, turn_delay, placeholder):
+    """
+    Wait out whatever part of the turn delay the response itself did not use.
+    
+    Sleeps in short steps and updates the placeholder between them so that a
+    Stop click can interrupt the script without waiting for the full delay.
+    """
+    deadline = started + turn_delay
+    while not st.session_state.stop_requested:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        placeholder.caption(f"⏳ Next turn in {remaining:.1f}s")
+        time.sleep(min(0.1, remaining))
+    placeholder.empty()
+
+
+def reset_conversation():
+    """Clear the conversation and everything derived from it."""
+    st.session_state.conversation_history = []
+    st.session_state.md_buffer = []
+    st.session_state.counts = new_counts()
+    st.session_state.transcript_exports = {}
+    st.session_state.session_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    st.session_state.current_turn = 0
+    st.session_state.stop_requested = False
+    st.session_state.orchestrator = None
+    discard_pending_turn()
+
+
+def orchestrator_fingerprint(config):
+    """Fingerprint the settings the orchestrator and its clients are built from."""
+    inputs = [config['discussion_topic'], config['temperature'], config['debug_mode']]
+    for key in ('model_a', 'model_b'):
+        model = config[key]
+        inputs += [model['persona'], model['api_key'], model['base_url'], model['name']]
+    return hashlib.blake2b(orjson.dumps(inputs), digest_size=8).digest()
+
+
 def initialize_clients(config):
     """Initialize LLM clients for both models."""
     try:
         # Initialize Model A client
-        st.session_state.model_a_client = LLMClient(
-            api_key=config['model_a']['api_key'],
-            base_url=config['model_a']['base_url'],
-            model=config['model_a']['name']
+        st.session_state.model_a_client = _get_client(
+            config['model_a']['api_key'],
+            config['model_a']['base_url'],
+            config['model_a']['name']
         )
         
         # Initialize Model B client
-        st.session_state.model_b_client = LLMClient(
-            api_key=config['model_b']['api_key'],
-            base_url=config['model_b']['base_url'],
-            model=config['model_b']['name']
+        st.session_state.model_b_client = _get_client(
+            config['model_b']['api_key'],
+            config['model_b']['base_url'],
+            config['model_b']['name']
         )
         
         return True, None
@@ -257,8 +400,38 @@ def initialize_clients(config):
         return False, f"Failed to initialize clients: {str(e)}"
 
 
-def generate_markdown_transcript(conversation_history, config):
-    """Generate a Markdown-formatted transcript of the conversation."""
+def format_transcript_turn(msg):
+    """Format a single message as a Markdown transcript block."""
+    lines = [f"### Turn {msg.turn}: {msg.speaker}"]
+    if msg.timestamp:
+        lines.append(f"*{msg.timestamp}*")
+    lines.append("")
+    lines.append(msg.content)
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def new_counts():
+    """Create empty running counters for a conversation."""
+    return {'speakers': Counter(), 'time_sum': 0.0, 'time_n': 0}
+
+
+def record_message(message):
+    """Append a message to the history and update the running transcript."""
+    st.session_state.conversation_history.append(message)
+    st.session_state.md_buffer.append(format_transcript_turn(message))
+    
+    counts = st.session_state.counts
+    counts['speakers'][message.speaker] += 1
+    if message.elapsed_time:
+        counts['time_sum'] += message.elapsed_time
+        counts['time_n'] += 1
+
+
+def generate_markdown_transcript(md_buffer, counts, config):
+    """Generate a Markdown-formatted transcript from the prebuilt turn blocks."""
     lines = []
     lines.append("# LLM Conversation Transcript")
     lines.append("")
@@ -281,42 +454,67 @@ def generate_markdown_transcript(conversation_history, config):
     lines.append("")
     lines.append("## Conversation")
     lines.append("")
-    
-    for msg in conversation_history:
-        speaker = msg['speaker']
-        content = msg['content']
-        turn = msg.get('turn', 0)
-        timestamp = msg.get('timestamp', '')
-        
-        lines.append(f"### Turn {turn}: {speaker}")
-        if timestamp:
-            lines.append(f"*{timestamp}*")
-        lines.append("")
-        lines.append(content)
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+    header = "\n".join(lines) + "\n"
     
     # Add statistics
+    lines = []
     lines.append("## Statistics")
     lines.append("")
-    lines.append(f"- **Total Turns:** {len(conversation_history)}")
-    model_a_count = sum(1 for msg in conversation_history if msg['speaker'] == 'Model A')
-    model_b_count = sum(1 for msg in conversation_history if msg['speaker'] == 'Model B')
-    lines.append(f"- **Model A Messages:** {model_a_count}")
-    lines.append(f"- **Model B Messages:** {model_b_count}")
+    lines.append(f"- **Total Turns:** {counts['speakers'].total()}")
+    lines.append(f"- **Model A Messages:** {counts['speakers']['Model A']}")
+    lines.append(f"- **Model B Messages:** {counts['speakers']['Model B']}")
     
     # Calculate average response times if available
-    response_times = [msg.get('elapsed_time') for msg in conversation_history if msg.get('elapsed_time')]
-    if response_times:
-        avg_time = sum(response_times) / len(response_times)
+    if counts['time_n']:
+        avg_time = counts['time_sum'] / counts['time_n']
         lines.append(f"- **Average Response Time:** {avg_time:.2f}s")
     
-    return "\n".join(lines)
+    return header + "".join(md_buffer) + "\n".join(lines)
+
+
+def get_transcript_exports(config):
+    """
+    Get the JSON and Markdown transcripts for the download buttons.
+    
+    Both are memoized in session state and only rebuilt when the
+    conversation has grown or the configuration has changed, not on
+    every rerun that shows the download buttons.
+    
+    Returns:
+        Tuple of (json_bytes, markdown_text)
+    """
+    key = (len(st.session_state.conversation_history), st.session_state.config_hash)
+    exports = st.session_state.transcript_exports
+    if exports.get('key') != key:
+        exports = {
+            'key': key,
+            'json': orjson.dumps(
+                st.session_state.conversation_history,
+                option=orjson.OPT_INDENT_2
+            ),
+            'md': generate_markdown_transcript(
+                st.session_state.md_buffer,
+                st.session_state.counts,
+                config
+            )
+        }
+        st.session_state.transcript_exports = exports
+    return exports['json'], exports['md']
+
+
+def render_message(speaker, nickname, turn, content):
+    """Render a single message as a chat bubble."""
+    with st.chat_message(speaker, avatar="🤖"):
+        st.markdown(f":{SPEAKER_COLORS[speaker]}[**{nickname}**] *(Turn {turn})*\n\n{content}")
 
 
 def render_conversation():
-    """Render the conversation history with visual distinction between speakers."""
+    """
+    Render the conversation history with visual distinction between speakers.
+    
+    Returns:
+        The container holding the messages, so new turns can be appended
+    """
     conversation_container = st.container()
     
     # Get nicknames from config
@@ -326,39 +524,66 @@ def render_conversation():
     
     with conversation_container:
         for msg in st.session_state.conversation_history:
-            speaker = msg['speaker']
-            content = msg['content']
-            turn = msg.get('turn', 0)
-            
-            # Create columns for alignment
-            if speaker == 'Model A':
-                col1, col2, col3 = st.columns([6, 1, 1])
-                with col1:
-                    st.markdown(
-                        f"<div style='background-color: #e3f2fd; padding: 15px; border-radius: 10px; "
-                        f"border-left: 5px solid #2196f3; margin-bottom: 10px;'>"
-                        f"<strong style='color: #1976d2;'>🤖 {nickname_a}</strong> <span style='color: #666; font-size: 0.9em;'>(Turn {turn})</span><br>"
-                        f"<span style='color: #333;'>{content}</span>"
-                        f"</div>",
-                        unsafe_allow_html=True
-                    )
-            else:  # Model B
-                col1, col2, col3 = st.columns([1, 1, 6])
-                with col3:
-                    st.markdown(
-                        f"<div style='background-color: #f3e5f5; padding: 15px; border-radius: 10px; "
-                        f"border-right: 5px solid #9c27b0; margin-bottom: 10px;'>"
-                        f"<strong style='color: #7b1fa2;'>🤖 {nickname_b}</strong> <span style='color: #666; font-size: 0.9em;'>(Turn {turn})</span><br>"
-                        f"<span style='color: #333;'>{content}</span>"
-                        f"</div>",
-                        unsafe_allow_html=True
-                    )
+            speaker = msg.speaker
+            nickname = nickname_a if speaker == 'Model A' else nickname_b
+            render_message(speaker, nickname, msg.turn, msg.content)
+    
+    return conversation_container
+
+
+def render_statistics(stats_area):
+    """Render the conversation statistics into a placeholder."""
+    if not st.session_state.conversation_history:
+        return
+    
+    with stats_area.container():
+        st.markdown("---")
+        st.subheader("📊 Conversation Statistics")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Total Turns", st.session_state.current_turn)
+        
+        # Counters are maintained by record_message, so no history scans here
+        speakers = st.session_state.counts['speakers']
+        
+        with col2:
+            st.metric("Total Messages", speakers.total())
+        
+        with col3:
+            st.metric("Model A Messages", speakers['Model A'])
+        
+        with col4:
+            st.metric("Model B Messages", speakers['Model B'])
 
 
-def run_conversation(config):
-    """Execute the conversation loop."""
-    # Initialize orchestrator if not already done
-    if st.session_state.orchestrator is None:
+def run_conversation(config, conversation_container, status_area, stats_area):
+    """
+    Execute the conversation loop.
+    
+    All turns run within a single script run: each finished message is
+    appended to the conversation container and the statistics are updated
+    in place, so nothing is rerun until the conversation ends or Stop is
+    clicked.
+    """
+    from conversation import ConversationOrchestrator
+    
+    # Initialize orchestrator if not already done, or rebuild it (and its
+    # clients) when settings it uses changed mid-conversation so the new
+    # personas, topic or models take effect. Display-only settings such as
+    # nicknames, max turns and the turn delay leave the pending turn alone.
+    fingerprint = orchestrator_fingerprint(config)
+    if (st.session_state.orchestrator is None
+            or st.session_state.orchestrator_config_hash != fingerprint):
+        discard_pending_turn()
+        success, error_msg = initialize_clients(config)
+        if not success:
+            status_area.error(error_msg)
+            st.session_state.is_running = False
+            st.session_state.stop_requested = True
+            return
+        st.session_state.orchestrator_config_hash = fingerprint
         st.session_state.orchestrator = ConversationOrchestrator(
             model_a_client=st.session_state.model_a_client,
             model_b_client=st.session_state.model_b_client,
@@ -366,60 +591,146 @@ def run_conversation(config):
             model_b_persona=config['model_b']['persona'],
             discussion_topic=config['discussion_topic'],
             temperature=config['temperature'],
-            system_prompt_file=Config.SYSTEM_PROMPT_FILE
+            system_prompt_file=get_config().system_prompt_file,
+            seed=DEBUG_SEED if config['debug_mode'] else None,
+            messages=st.session_state.conversation_history
         )
     
-    # Get next turn number
-    next_turn = st.session_state.current_turn + 1
     max_turns = config['max_turns']
+    delay_placeholder = status_area.empty()
     
-    # Check if conversation should continue
-    if next_turn > max_turns or st.session_state.stop_requested:
-        st.session_state.is_running = False
-        if next_turn > max_turns:
-            st.success(f"✅ Conversation completed! Reached maximum of {max_turns} turns.")
-        else:
-            st.warning("⏹️ Conversation stopped by user.")
-        return
-    
-    # Show progress indicator with nickname (non-blocking)
-    is_model_a = (next_turn % 2 == 1)
-    nickname = config['model_a']['nickname'] if is_model_a else config['model_b']['nickname']
-    
-    # Create status container
-    status_container = st.empty()
-    status_container.info(f"🤔 {nickname} is thinking... (Turn {next_turn}/{max_turns})")
-    
-    # Get next response
-    result = st.session_state.orchestrator.get_next_response(next_turn)
-    
-    # Clear status
-    status_container.empty()
-    
-    if result['success']:
+    while True:
+        # Get next turn number
+        next_turn = st.session_state.current_turn + 1
+        
+        # Check if conversation should continue
+        if next_turn > max_turns or st.session_state.stop_requested:
+            discard_pending_turn()
+            st.session_state.is_running = False
+            with status_area:
+                if next_turn > max_turns:
+                    st.success(f"✅ Conversation completed! Reached maximum of {max_turns} turns.")
+                else:
+                    st.warning("⏹️ Conversation stopped by user.")
+            return
+        
+        # Show progress indicator with nickname (non-blocking)
+        is_model_a = (next_turn % 2 == 1)
+        nickname = config['model_a']['nickname'] if is_model_a else config['model_b']['nickname']
+        
+        # Create status container at the end of the conversation
+        status_container = conversation_container.empty()
+        status_container.info(f"🤔 {nickname} is thinking... (Turn {next_turn}/{max_turns})")
+        
+        # Get next response; a turn still in flight from an interrupted run
+        # (e.g. a rerun that leaves the orchestrator's settings unchanged, such
+        # as editing a nickname) is picked up instead of being requested again
+        if st.session_state.pending_turn is None:
+            st.session_state.pending_turn = submit_turn(st.session_state.orchestrator, next_turn)
+        job = st.session_state.pending_turn
+        
+        # Show tokens as they stream in, redrawing at most ~10 times per second.
+        # Every pass touches the placeholder, even before the first token or
+        # during a retry backoff, so Streamlit can interrupt the script if Stop
+        # is clicked.
+        rendered_chunks = 0
+        while not wait([job['future']], timeout=0.1).done:
+            if not job['chunks']:
+                elapsed = time.monotonic() - job['started']
+                status_container.info(
+                    f"🤔 {nickname} is thinking... (Turn {next_turn}/{max_turns}, {elapsed:.0f}s)"
+                )
+            elif len(job['chunks']) != rendered_chunks:
+                rendered_chunks = len(job['chunks'])
+                with status_container.container():
+                    render_message(
+                        'Model A' if is_model_a else 'Model B',
+                        nickname,
+                        next_turn,
+                        "".join(job['chunks'][:rendered_chunks])
+                    )
+        
+        st.session_state.pending_turn = None
+        result = job['future'].result()
+        
+        if not result['success']:
+            # Clear status
+            status_container.empty()
+            
+            # Handle error
+            status_area.error(f"❌ Error getting response from {result['speaker']}: {result['error']}")
+            st.session_state.is_running = False
+            st.session_state.stop_requested = True
+            return
+        
         # Add to conversation history
-        st.session_state.conversation_history.append({
-            'turn': result['turn'],
-            'speaker': result['speaker'],
-            'content': result['content'],
-            'timestamp': datetime.now().isoformat(),
-            'usage': result.get('usage'),
-            'elapsed_time': result.get('elapsed_time')
-        })
+        record_message(result['message'])
         
         # Update turn counter
         st.session_state.current_turn = next_turn
         
-        # Configurable delay to prevent rate limiting
-        time.sleep(config.get('turn_delay', 1.0))
+        # The status container becomes the finished message
+        with status_container.container():
+            render_message(result['speaker'], nickname, next_turn, result['message'].content)
+        render_statistics(stats_area)
         
-        # Rerun to display new message and continue
-        st.rerun()
+        # Configurable delay to prevent rate limiting, counted from the start
+        # of the request so time spent generating is not waited twice
+        wait_for_turn_delay(job['started'], config.get('turn_delay', 1.0), delay_placeholder)
+
+
+@st.fragment
+def conversation_view(config):
+    """
+    Render the conversation area and run the conversation loop.
+    
+    Runs as a fragment so the loop and its updates only touch this part
+    of the page instead of the whole script with every sidebar widget.
+    """
+    # Display conversation or info message
+    conversation_container = None
+    if st.session_state.conversation_history or st.session_state.is_running:
+        st.markdown("### ⚔️ Conversation")
+        conversation_container = render_conversation()
     else:
-        # Handle error
-        st.error(f"❌ Error getting response from {result['speaker']}: {result['error']}")
-        st.session_state.is_running = False
-        st.session_state.stop_requested = True
+        st.info("👆 Configure the models in the sidebar and click 'Start Conversation' to begin.")
+    
+    # Reserve the areas below the conversation so the loop can fill them in
+    status_area = st.container()
+    export_area = st.container()
+    stats_area = st.empty()
+    render_statistics(stats_area)
+    
+    # Run conversation if active - MUST be after buttons
+    if st.session_state.is_running:
+        run_conversation(config, conversation_container, status_area, stats_area)
+    
+    # Export transcript button
+    if st.session_state.conversation_history and not st.session_state.is_running:
+        with export_area:
+            st.markdown("---")
+            col1, col2, col3 = st.columns([1, 1, 4])
+            
+            with col1:
+                # Export as JSON
+                transcript_json, transcript_md = get_transcript_exports(config)
+                st.download_button(
+                    label="📥 Download JSON",
+                    data=transcript_json,
+                    file_name=f"conversation_{st.session_state.session_stamp}.json",
+                    mime="application/json",
+                    use_container_width=True
+                )
+            
+            with col2:
+                # Export as Markdown
+                st.download_button(
+                    label="📥 Download Markdown",
+                    data=transcript_md,
+                    file_name=f"conversation_{st.session_state.session_stamp}.md",
+                    mime="text/markdown",
+                    use_container_width=True
+                )
 
 
 def main():
@@ -453,10 +764,7 @@ def main():
                         st.error(error_msg)
                     else:
                         # Reset conversation state
-                        st.session_state.conversation_history = []
-                        st.session_state.current_turn = 0
-                        st.session_state.stop_requested = False
-                        st.session_state.orchestrator = None
+                        reset_conversation()
                         st.session_state.is_running = True
                         st.rerun()
     
@@ -465,84 +773,18 @@ def main():
             if st.button("⏹️ Stop", type="secondary", use_container_width=True, key="stop_btn"):
                 st.session_state.stop_requested = True
                 st.session_state.is_running = False
+                discard_pending_turn()
                 st.rerun()
     
     with col3:
         if st.session_state.conversation_history and not st.session_state.is_running:
             if st.button("🔄 New Conversation", type="secondary", use_container_width=True, key="new_btn"):
                 # Reset conversation state
-                st.session_state.conversation_history = []
-                st.session_state.current_turn = 0
-                st.session_state.stop_requested = False
-                st.session_state.orchestrator = None
+                reset_conversation()
                 st.rerun()
     
-    # Display conversation or info message
-    if st.session_state.conversation_history:
-        st.markdown("### ⚔️ Conversation")
-        render_conversation()
-    elif not st.session_state.is_running:
-        st.info("👆 Configure the models in the sidebar and click 'Start Conversation' to begin.")
-    
-    # Run conversation if active - MUST be after buttons
-    if st.session_state.is_running:
-        run_conversation(config)
-    
-    # Export transcript button
-    if st.session_state.conversation_history and not st.session_state.is_running:
-        st.markdown("---")
-        col1, col2, col3 = st.columns([1, 1, 4])
-        
-        with col1:
-            # Export as JSON
-            transcript_json = json.dumps(
-                st.session_state.conversation_history,
-                indent=2,
-                ensure_ascii=False
-            )
-            st.download_button(
-                label="📥 Download JSON",
-                data=transcript_json,
-                file_name=f"conversation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json",
-                use_container_width=True
-            )
-        
-        with col2:
-            # Export as Markdown
-            transcript_md = generate_markdown_transcript(
-                st.session_state.conversation_history,
-                config
-            )
-            st.download_button(
-                label="📥 Download Markdown",
-                data=transcript_md,
-                file_name=f"conversation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                mime="text/markdown",
-                use_container_width=True
-            )
-    
-    # Display conversation statistics
-    if st.session_state.conversation_history:
-        st.markdown("---")
-        st.subheader("📊 Conversation Statistics")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Total Turns", st.session_state.current_turn)
-        
-        with col2:
-            total_messages = len(st.session_state.conversation_history)
-            st.metric("Total Messages", total_messages)
-        
-        with col3:
-            model_a_messages = sum(1 for msg in st.session_state.conversation_history if msg['speaker'] == 'Model A')
-            st.metric("Model A Messages", model_a_messages)
-        
-        with col4:
-            model_b_messages = sum(1 for msg in st.session_state.conversation_history if msg['speaker'] == 'Model B')
-            st.metric("Model B Messages", model_b_messages)
+    # Conversation area runs the turn loop without rerunning the page
+    conversation_view(config)
 
 
 if __name__ == "__main__":
@@ -4,19 +4,27 @@ Handles loading configuration from environment variables with fallbacks.
 """
 
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
-# Load environment variables from .env file
-load_dotenv()
+
+@lru_cache(maxsize=1)
+def _ensure_env_loaded():
+    """Load environment variables from .env file on first use."""
+    from dotenv import load_dotenv
+    load_dotenv()
 
 
 def get_env(key: str, default: str = "") -> str:
     """Get environment variable with default fallback."""
+    _ensure_env_loaded()
     return os.getenv(key, default)
 
 
 def get_env_float(key: str, default: float) -> float:
     """Get environment variable as float with default fallback."""
+    _ensure_env_loaded()
     try:
         return float(os.getenv(key, str(default)))
     except (ValueError, TypeError):
@@ -25,75 +33,100 @@ def get_env_float(key: str, default: float) -> float:
 
 def get_env_int(key: str, default: int) -> int:
     """Get environment variable as int with default fallback."""
+    _ensure_env_loaded()
     try:
         return int(os.getenv(key, str(default)))
     except (ValueError, TypeError):
         return default
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
     """Application configuration with environment variable support."""
     
     # Model A Configuration
-    MODEL_A_API_KEY = get_env("MODEL_A_API_KEY") or get_env("OPENAI_API_KEY")
-    MODEL_A_BASE_URL = get_env("MODEL_A_BASE_URL") or None
-    MODEL_A_NAME = get_env("MODEL_A_NAME", "gpt-4.1-mini")
-    MODEL_A_NICKNAME = get_env("MODEL_A_NICKNAME", "Alice")
-    MODEL_A_PERSONA = get_env(
-        "MODEL_A_PERSONA",
-        "You are a thoughtful and analytical assistant who enjoys exploring ideas in depth."
-    )
+    model_a_api_key: str
+    model_a_base_url: Optional[str]
+    model_a_name: str
+    model_a_nickname: str
+    model_a_persona: str
     
     # Model B Configuration
-    MODEL_B_API_KEY = get_env("MODEL_B_API_KEY") or get_env("OPENAI_API_KEY")
-    MODEL_B_BASE_URL = get_env("MODEL_B_BASE_URL") or None
-    MODEL_B_NAME = get_env("MODEL_B_NAME", "gpt-4.1-nano")
-    MODEL_B_NICKNAME = get_env("MODEL_B_NICKNAME", "Bob")
-    MODEL_B_PERSONA = get_env(
-        "MODEL_B_PERSONA",
-        "You are a creative and curious assistant who likes to ask questions and challenge assumptions."
-    )
+    model_b_api_key: str
+    model_b_base_url: Optional[str]
+    model_b_name: str
+    model_b_nickname: str
+    model_b_persona: str
     
     # Conversation Settings
-    DISCUSSION_TOPIC = get_env(
-        "DISCUSSION_TOPIC",
-        "The impact of artificial intelligence on society"
-    )
-    MAX_TURNS = get_env_int("MAX_TURNS", 10)
-    TEMPERATURE = get_env_float("TEMPERATURE", 0.7)
-    TURN_DELAY = get_env_float("TURN_DELAY", 1.0)
-    SYSTEM_PROMPT_FILE = get_env("SYSTEM_PROMPT_FILE", "system_prompt.txt")
+    discussion_topic: str
+    max_turns: int
+    temperature: float
+    turn_delay: float
+    system_prompt_file: str
     
     @classmethod
-    def get_model_a_config(cls):
+    def from_env(cls) -> "Config":
+        """Build configuration from environment variables."""
+        return cls(
+            model_a_api_key=get_env("MODEL_A_API_KEY") or get_env("OPENAI_API_KEY"),
+            model_a_base_url=get_env("MODEL_A_BASE_URL") or None,
+            model_a_name=get_env("MODEL_A_NAME", "gpt-4.1-mini"),
+            model_a_nickname=get_env("MODEL_A_NICKNAME", "Alice"),
+            model_a_persona=get_env(
+                "MODEL_A_PERSONA",
+                "You are a thoughtful and analytical assistant who enjoys exploring ideas in depth."
+            ),
+            model_b_api_key=get_env("MODEL_B_API_KEY") or get_env("OPENAI_API_KEY"),
+            model_b_base_url=get_env("MODEL_B_BASE_URL") or None,
+            model_b_name=get_env("MODEL_B_NAME", "gpt-4.1-nano"),
+            model_b_nickname=get_env("MODEL_B_NICKNAME", "Bob"),
+            model_b_persona=get_env(
+                "MODEL_B_PERSONA",
+                "You are a creative and curious assistant who likes to ask questions and challenge assumptions."
+            ),
+            discussion_topic=get_env(
+                "DISCUSSION_TOPIC",
+                "The impact of artificial intelligence on society"
+            ),
+            max_turns=get_env_int("MAX_TURNS", 10),
+            temperature=get_env_float("TEMPERATURE", 0.7),
+            turn_delay=get_env_float("TURN_DELAY", 1.0),
+            system_prompt_file=get_env("SYSTEM_PROMPT_FILE", "system_prompt.txt")
+        )
+    
+    def get_model_a_config(self):
         """Get Model A configuration as dictionary."""
         return {
-            'api_key': cls.MODEL_A_API_KEY,
-            'base_url': cls.MODEL_A_BASE_URL,
-            'name': cls.MODEL_A_NAME,
-            'nickname': cls.MODEL_A_NICKNAME,
-            'persona': cls.MODEL_A_PERSONA
+            'api_key': self.model_a_api_key,
+            'base_url': self.model_a_base_url,
+            'name': self.model_a_name,
+            'nickname': self.model_a_nickname,
+            'persona': self.model_a_persona
         }
     
-    @classmethod
-    def get_model_b_config(cls):
+    def get_model_b_config(self):
         """Get Model B configuration as dictionary."""
         return {
-            'api_key': cls.MODEL_B_API_KEY,
-            'base_url': cls.MODEL_B_BASE_URL,
-            'name': cls.MODEL_B_NAME,
-            'nickname': cls.MODEL_B_NICKNAME,
-            'persona': cls.MODEL_B_PERSONA
+            'api_key': self.model_b_api_key,
+            'base_url': self.model_b_base_url,
+            'name': self.model_b_name,
+            'nickname': self.model_b_nickname,
+            'persona': self.model_b_persona
         }
     
-    @classmethod
-    def get_conversation_config(cls):
+    def get_conversation_config(self):
         """Get conversation configuration as dictionary."""
         return {
-            'discussion_topic': cls.DISCUSSION_TOPIC,
-            'max_turns': cls.MAX_TURNS,
-            'temperature': cls.TEMPERATURE,
-            'turn_delay': cls.TURN_DELAY,
-            'system_prompt_file': cls.SYSTEM_PROMPT_FILE
+            'discussion_topic': self.discussion_topic,
+            'max_turns': self.max_turns,
+            'temperature': self.temperature,
+            'turn_delay': self.turn_delay,
+            'system_prompt_file': self.system_prompt_file
         }
 
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the application configuration, reading the environment only once."""
+    return Config.from_env()
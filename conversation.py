@@ -2,14 +2,131 @@
 Manages the dialogue flow between two LLM models.
 """
 
-from typing import List, Dict, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Awaitable, Callable, List, Dict, Optional
 from llm_client import LLMClient
+import logging
+import orjson
 import os
+import re
+
+
+logger = logging.getLogger(__name__)
+
+# Role each speaker's messages take in (Model A's, Model B's) context
+_ROLES = {
+    "Model A": ("assistant", "user"),
+    "Model B": ("user", "assistant")
+}
+
+
+class _FrozenMessage(dict):
+    """An API message that raises on modification; copies are plain dicts."""
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("this message is read-only")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+# Prompt sent after a model's own message so it is asked to reply again
+_CONTINUE_MSG = _FrozenMessage(role="user", content="Please continue the conversation.")
+_CONTINUE_JSON = orjson.dumps(_CONTINUE_MSG)
+
+# System prompt template used when the prompt file doesn't exist
+_DEFAULT_PROMPT = (
+    "You are having a conversation with another AI assistant about: {topic}\n\n"
+    "Guidelines:\n"
+    "- Keep responses conversational and natural (2-4 sentences typically)\n"
+    "- Build on what the other assistant has said\n"
+    "- Feel free to ask questions, agree, disagree, or introduce new perspectives\n"
+    "- Stay on topic but allow the conversation to evolve naturally\n"
+    "- Be respectful and constructive in your dialogue"
+)
+
+
+@lru_cache(maxsize=8)
+def _load_system_prompt_cached(path: str) -> str:
+    """
+    Read a system prompt template, once per path for the whole process.
+    
+    Edits to the file are picked up after a restart.
+    """
+    if not os.path.exists(path):
+        return _DEFAULT_PROMPT
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().strip()
+
+
+# Most turns generated by one marshaled request; longer simulated dialogues
+# drift from the personas and are more likely to break the output format
+_MARSHAL_MAX_TURNS = 8
+_MARSHAL_TURN_RE = re.compile(r"^\s*\**([AB])\**\s*:\s*\**\s*(.*)$")
+
+
+def _parse_marshaled_turns(text: str, first_speaker: str, count: int) -> Optional[List[str]]:
+    """
+    Split a simulated dialogue into its turns.
+    
+    Args:
+        text: Model output with each turn starting on a new line as "A: ..." or "B: ..."
+        first_speaker: Letter of the speaker expected to open ("A" or "B")
+        count: Number of turns expected
+    
+    Returns:
+        The content of each turn, or None if the output doesn't match the format
+    """
+    turns = []
+    for line in text.splitlines():
+        match = _MARSHAL_TURN_RE.match(line)
+        if match:
+            turns.append((match.group(1), [match.group(2)]))
+        elif turns and line.strip():
+            turns[-1][1].append(line.strip())
+    
+    if len(turns) < count:
+        return None
+    
+    order = ("A", "B") if first_speaker == "A" else ("B", "A")
+    contents = []
+    for i, (letter, lines) in enumerate(turns[:count]):
+        content = "\n".join(lines).strip()
+        if letter != order[i % 2] or not content:
+            return None
+        contents.append(content)
+    return contents
+
+
+@dataclass(frozen=True, slots=True)
+class ConversationMessage:
+    """A single completed turn of the conversation; immutable once recorded."""
+    
+    turn: int
+    speaker: str
+    content: str
+    timestamp: str
+    usage: Optional[Dict[str, int]] = None
+    elapsed_time: Optional[float] = None
 
 
 class ConversationOrchestrator:
     """Orchestrates conversation between two LLM models."""
     
+    __slots__ = (
+        "model_a_client", "model_b_client", "model_a_persona", "model_b_persona",
+        "discussion_topic", "temperature", "system_prompt_file", "seed", "max_tokens_per_turn",
+        "messages", "_recorded_count", "system_prompt_template",
+        "_system_msg_a", "_system_msg_b", "_opener_msg", "_ctx_a", "_ctx_b",
+        "_ctx_a_json", "_ctx_b_json", "window_size", "summarize_history",
+        "_window_start", "_rolling_summary"
+    )
+    
     def __init__(
         self,
         model_a_client: LLMClient,
@@ -18,7 +135,12 @@ class ConversationOrchestrator:
         model_b_persona: str,
         discussion_topic: str,
         temperature: float = 0.7,
-        system_prompt_file: str = "system_prompt.txt"
+        system_prompt_file: str = "system_prompt.txt",
+        seed: Optional[int] = None,
+        messages: Optional[List[ConversationMessage]] = None,
+        max_tokens_per_turn: Optional[int] = 200,
+        window_size: Optional[int] = 16,
+        summarize_history: bool = False
     ):
         """
         Initialize conversation orchestrator.
@@ -30,6 +152,13 @@ class ConversationOrchestrator:
             model_b_persona: Persona description for Model B
             discussion_topic: Topic of discussion
             temperature: Sampling temperature for responses
+            seed: Sampling seed for reproducible, cacheable responses (optional)
+            messages: Previously recorded turns to continue from (optional)
+            max_tokens_per_turn: Cap on each response's length, so a model that
+                ignores the "2-4 sentences" guideline still stops early (None for no cap)
+            window_size: Most recent turns sent to the models, at least 2 (None to send all)
+            summarize_history: Replace turns that leave the window with a short
+                summary generated by Model A's client
         """
         self.model_a_client = model_a_client
         self.model_b_client = model_b_client
@@ -38,146 +167,270 @@ class ConversationOrchestrator:
         self.discussion_topic = discussion_topic
         self.temperature = temperature
         self.system_prompt_file = system_prompt_file
+        self.seed = seed
+        self.max_tokens_per_turn = max_tokens_per_turn
         
-        # Store messages as they are exchanged
-        self.messages: List[Dict[str, str]] = []
+        # Store messages as they are exchanged. The history is append-only:
+        # editing or dropping earlier turns would change every later prompt's
+        # prefix and force the provider to prefill the whole context again
+        self.messages: List[ConversationMessage] = list(messages or [])
+        self._recorded_count = len(self.messages)
         
         # Load system prompt template
         self.system_prompt_template = self._load_system_prompt()
+        
+        # Combine each persona with the system prompt once. Provider prompt
+        # caching keys on the longest unchanged prefix, so the system messages
+        # must stay byte-identical for the whole conversation: they are frozen
+        # here, and any per-turn state (memory, timestamps, ...) belongs in a
+        # trailing user message, never in the system prompt
+        system_prompt = self.system_prompt_template.format(topic=self.discussion_topic)
+        self._system_msg_a = _FrozenMessage(role="system", content=f"{model_a_persona}\n\n{system_prompt}")
+        self._system_msg_b = _FrozenMessage(role="system", content=f"{model_b_persona}\n\n{system_prompt}")
+        self._opener_msg = _FrozenMessage(
+            role="user",
+            content=f"Please start a conversation about: {discussion_topic}. Share your initial thoughts on this topic in 2-4 sentences."
+        )
+        
+        # Only the most recent turns are sent to the models. Turns that
+        # were seeded before the window existed are dropped unsummarized
+        if window_size is not None and window_size < 2:
+            raise ValueError("window_size must be at least 2")
+        self.window_size = window_size
+        self.summarize_history = summarize_history
+        self._window_start = 0
+        self._rolling_summary: Optional[str] = None
+        self._take_overflow()
+        
+        # Per-model API contexts, extended as each turn is recorded
+        self._reset_contexts()
     
     def _load_system_prompt(self) -> str:
         """Load system prompt from file."""
         try:
-            if os.path.exists(self.system_prompt_file):
-                with open(self.system_prompt_file, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-            else:
-                # Fallback to default prompt if file doesn't exist
-                return (
-                    "You are having a conversation with another AI assistant about: {topic}\n\n"
-                    "Guidelines:\n"
-                    "- Keep responses conversational and natural (2-4 sentences typically)\n"
-                    "- Build on what the other assistant has said\n"
-                    "- Feel free to ask questions, agree, disagree, or introduce new perspectives\n"
-                    "- Stay on topic but allow the conversation to evolve naturally\n"
-                    "- Be respectful and constructive in your dialogue"
-                )
+            return _load_system_prompt_cached(self.system_prompt_file)
         except Exception as e:
             print(f"Warning: Could not load system prompt file: {e}")
             return "You are having a conversation with another AI assistant about: {topic}"
     
-    def _build_context_for_model(
-        self,
-        persona: str,
-        is_model_a: bool
-    ) -> List[Dict[str, str]]:
+    def _append_to_contexts(self, message: ConversationMessage):
+        """
+        Add a recorded turn to both models' contexts.
+        
+        Each model sees the conversation from its own perspective: its own
+        messages are "assistant" turns and the other model's are "user" turns.
+        """
+        role_a, role_b = _ROLES[message.speaker]
+        msg_a = {"role": role_a, "content": message.content}
+        msg_b = {"role": role_b, "content": message.content}
+        self._ctx_a.append(msg_a)
+        self._ctx_b.append(msg_b)
+        if self._ctx_a_json is not None:
+            self._ctx_a_json += b"," + orjson.dumps(msg_a)
+        if self._ctx_b_json is not None:
+            self._ctx_b_json += b"," + orjson.dumps(msg_b)
+    
+    def _reset_contexts(self):
+        """Rebuild both models' contexts from the recorded turns in the window."""
+        # Keep every context append-only so providers with prefix caching
+        # can reuse the previous turn's prompt: the system message and the
+        # opener never change, and each turn only adds messages at the end
+        # until the window next moves. Model A always sees the opener, not
+        # just on the very first turn.
+        self._ctx_a = [self._system_msg_a, self._opener_msg]
+        self._ctx_b = [self._system_msg_b]
+        for message in self.messages[self._window_start:]:
+            role_a, role_b = _ROLES[message.speaker]
+            self._ctx_a.append({"role": role_a, "content": message.content})
+            self._ctx_b.append({"role": role_b, "content": message.content})
+        
+        # Earlier turns, if summarized, are folded into the first user
+        # message rather than added as one of their own, so roles keep
+        # alternating: into the opener for Model A, and into Model A's first
+        # turn in the window for Model B
+        if self._rolling_summary:
+            summary = f"Summary of the conversation so far: {self._rolling_summary}"
+            self._ctx_a[1] = {"role": "user", "content": f"{self._opener_msg['content']}\n\n{summary}"}
+            if len(self._ctx_b) > 1:
+                self._ctx_b[1] = {"role": "user", "content": f"{summary}\n\n{self._ctx_b[1]['content']}"}
+            else:
+                self._ctx_b.append({"role": "user", "content": summary})
+        
+        # For clients that send pre-encoded messages, the same contexts as
+        # JSON arrays missing their closing bracket, so each turn encodes only
+        # its new message rather than the whole history
+        self._ctx_a_json = None
+        self._ctx_b_json = None
+        if self.model_a_client.accepts_encoded_messages:
+            self._ctx_a_json = bytearray(orjson.dumps(self._ctx_a)[:-1])
+        if self.model_b_client.accepts_encoded_messages:
+            self._ctx_b_json = bytearray(orjson.dumps(self._ctx_b)[:-1])
+    
+    def _take_overflow(self) -> List[ConversationMessage]:
+        """
+        Move the window past its oldest turns once it holds too many.
+        
+        The window moves by half its size at a time, so between moves the
+        contexts stay append-only and their prompt prefix stays cacheable.
+        The step is kept even so the window always opens on a Model A turn
+        and user/assistant roles keep alternating after the prefix.
+        
+        Returns:
+            The turns that left the window
+        """
+        if self.window_size is None:
+            return []
+        
+        start = self._window_start
+        step = max(2, self.window_size // 2 // 2 * 2)
+        while len(self.messages) - self._window_start > self.window_size:
+            self._window_start += step
+        return self.messages[start:self._window_start]
+    
+    def _summary_request(self, dropped: List[ConversationMessage]) -> List[Dict[str, str]]:
+        """Build the messages asking for a summary of turns leaving the window."""
+        transcript = "\n\n".join(f"{message.speaker}: {message.content}" for message in dropped)
+        if self._rolling_summary:
+            transcript = f"Earlier summary: {self._rolling_summary}\n\n{transcript}"
+        return [
+            {
+                "role": "system",
+                "content": "Summarize this dialogue in 2-3 sentences, keeping each speaker's main points. Output only the summary."
+            },
+            {"role": "user", "content": transcript}
+        ]
+    
+    def _update_summary(self, result: Dict[str, any]):
+        """Store a newly generated summary, keeping the previous one on failure."""
+        summary = (result['content'] or "").strip() if result['success'] else ""
+        if summary:
+            self._rolling_summary = summary
+        else:
+            # A refused or filtered completion can succeed with no content
+            logger.warning("Could not summarize earlier turns: %s", result['error'] or "empty summary")
+    
+    def _slide_window(self):
+        """Drop turns that no longer fit the window, summarizing them if enabled."""
+        dropped = self._take_overflow()
+        if not dropped:
+            return
+        
+        if self.summarize_history:
+            self._update_summary(self.model_a_client.generate_response(
+                messages=self._summary_request(dropped),
+                temperature=0,
+                max_tokens=120
+            ))
+        self._reset_contexts()
+    
+    async def _aslide_window(self, before_request: Optional[Callable[[], Awaitable[None]]] = None):
+        """Drop turns that no longer fit the window without blocking the event loop."""
+        dropped = self._take_overflow()
+        if not dropped:
+            return
+        
+        if self.summarize_history:
+            self._update_summary(await self.model_a_client.agenerate_response(
+                messages=self._summary_request(dropped),
+                temperature=0,
+                max_tokens=120,
+                before_request=before_request
+            ))
+        self._reset_contexts()
+    
+    def _build_context_for_model(self, is_model_a: bool) -> List[Dict[str, str]]:
         """
         Build conversation context for a specific model.
         
+        The contexts are maintained incrementally as turns are recorded, so
+        this is O(1) rather than a rebuild of the whole history. The returned
+        list must not be modified by the caller.
+        
         Args:
-            persona: The persona description for this model
             is_model_a: Whether this is Model A (True) or Model B (False)
         
         Returns:
             List of messages formatted for the API
         """
-        # Start with system message
-        # Combine persona with system prompt template
-        system_prompt = self.system_prompt_template.format(topic=self.discussion_topic)
-        system_message = {
-            "role": "system",
-            "content": f"{persona}\n\n{system_prompt}"
-        }
-        
-        messages = [system_message]
-        
-        # If this is the very first message (Model A starting)
-        if len(self.messages) == 0 and is_model_a:
-            messages.append({
-                "role": "user",
-                "content": f"Please start a conversation about: {self.discussion_topic}. Share your initial thoughts on this topic in 2-4 sentences."
-            })
-        else:
-            # Build conversation history with proper role alternation
-            # The pattern must be: user → assistant → user → assistant
-            # Each model sees the conversation from its own perspective
-            
-            for i, msg in enumerate(self.messages):
-                # Determine which model sent this message
-                # Turn 1 (index 0) = Model A, Turn 2 (index 1) = Model B, etc.
-                msg_is_from_model_a = (i % 2 == 0)
-                
-                if msg_is_from_model_a == is_model_a:
-                    # This is our own previous message - role is "assistant"
-                    messages.append({
-                        "role": "assistant",
-                        "content": msg["content"]
-                    })
-                else:
-                    # This is the other model's message - role is "user"
-                    messages.append({
-                        "role": "user",
-                        "content": msg["content"]
-                    })
-            
-            # Ensure we end with a user message to prompt the next response
-            # Check the last message role
-            if len(messages) > 1 and messages[-1]["role"] == "assistant":
-                # We need to add a user prompt
-                messages.append({
-                    "role": "user",
-                    "content": "Please continue the conversation."
-                })
+        messages = self._ctx_a if is_model_a else self._ctx_b
+        
+        # Ensure we end with a user message to prompt the next response,
+        # without adding the prompt to the stored context
+        if len(messages) > 1 and messages[-1]["role"] == "assistant":
+            return messages + [_CONTINUE_MSG]
         
         return messages
     
-    def get_next_response(self, turn_number: int) -> Dict[str, any]:
+    def _build_context_json(self, is_model_a: bool) -> bytes:
         """
-        Get the next response in the conversation.
+        Get a model's context as an encoded JSON array.
+        
+        Matches _build_context_for_model, for clients that accept encoded
+        messages.
         
         Args:
-            turn_number: Current turn number (1-indexed)
+            is_model_a: Whether this is Model A (True) or Model B (False)
         
         Returns:
-            Dictionary containing response data and metadata
+            JSON-encoded list of messages
+        """
+        messages = self._ctx_a if is_model_a else self._ctx_b
+        encoded = self._ctx_a_json if is_model_a else self._ctx_b_json
+        
+        # join() sizes the result once up front, where chained + would copy
+        # the whole encoded history for every piece appended
+        if len(messages) > 1 and messages[-1]["role"] == "assistant":
+            return b"".join((encoded, b",", _CONTINUE_JSON, b"]"))
+        
+        return b"".join((encoded, b"]"))
+    
+    def _prepare_turn(self, turn_number: int):
+        """
+        Select the responding model and build its context for a turn.
+        
+        Returns:
+            Tuple of (client, speaker, context_messages)
         """
+        assert len(self.messages) >= self._recorded_count, "conversation history must be append-only"
+        
         # Determine which model should respond
         # Turn 1: Model A, Turn 2: Model B, Turn 3: Model A, etc.
         is_model_a_turn = (turn_number % 2 == 1)
         
         if is_model_a_turn:
             client = self.model_a_client
-            persona = self.model_a_persona
             speaker = "Model A"
         else:
             client = self.model_b_client
-            persona = self.model_b_persona
             speaker = "Model B"
         
         # Build context for this model
-        context_messages = self._build_context_for_model(persona, is_model_a_turn)
+        context_messages = self._build_context_for_model(is_model_a_turn)
         
-        # Debug logging
-        print(f"\n=== Turn {turn_number}: {speaker} ===")
-        print(f"Messages sent to API:")
-        for i, msg in enumerate(context_messages):
-            content_preview = msg['content'][:60] + '...' if len(msg['content']) > 60 else msg['content']
-            print(f"  {i}: {msg['role']}: {content_preview}")
-        print()
-        
-        # Get response from the model
-        result = client.generate_response(
-            messages=context_messages,
-            temperature=self.temperature
-        )
+        # Debug logging, skipped entirely unless DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("=== Turn %d: %s ===", turn_number, speaker)
+            logger.debug("Messages sent to API:")
+            for i, msg in enumerate(context_messages):
+                logger.debug("  %d: %s: %.60s", i, msg['role'], msg['content'])
         
+        return client, speaker, context_messages
+    
+    def _record_result(self, result: Dict[str, any], speaker: str, turn_number: int) -> Dict[str, any]:
+        """Add a successful response to the history and tag the result with its turn."""
         # If successful, add to message history
         if result['success']:
-            self.messages.append({
-                "content": result['content'],
-                "speaker": speaker,
-                "turn": turn_number
-            })
+            result['message'] = ConversationMessage(
+                turn=turn_number,
+                speaker=speaker,
+                content=result['content'],
+                timestamp=datetime.now().isoformat(),
+                usage=result.get('usage'),
+                elapsed_time=result.get('elapsed_time')
+            )
+            self.messages.append(result['message'])
+            self._recorded_count = len(self.messages)
+            self._append_to_contexts(result['message'])
         
         # Add speaker information to result
         result['speaker'] = speaker
@@ -185,16 +438,203 @@ class ConversationOrchestrator:
         
         return result
     
-    def get_conversation_transcript(self) -> List[Dict[str, str]]:
+    def get_next_response(
+        self,
+        turn_number: int,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> Dict[str, any]:
+        """
+        Get the next response in the conversation.
+        
+        Args:
+            turn_number: Current turn number (1-indexed)
+            on_chunk: Callback receiving streamed content deltas (optional)
+            should_stop: Polled while streaming to abort the turn early (optional)
+        
+        Returns:
+            Dictionary containing response data and metadata
+        """
+        client, speaker, context_messages = self._prepare_turn(turn_number)
+        
+        # Get response from the model
+        result = client.generate_response(
+            messages=context_messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens_per_turn,
+            on_chunk=on_chunk,
+            should_stop=should_stop,
+            seed=self.seed
+        )
+        
+        result = self._record_result(result, speaker, turn_number)
+        self._slide_window()
+        return result
+    
+    async def aget_next_response(
+        self,
+        turn_number: int,
+        before_request: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> Dict[str, any]:
+        """
+        Get the next response in the conversation without blocking the event loop.
+        
+        Turns within one conversation are still sequential, but several
+        orchestrators can await their turns concurrently.
+        
+        Args:
+            turn_number: Current turn number (1-indexed)
+            before_request: Awaited before every API request, including
+                retries, e.g. to wait for a rate limiter (optional)
+        
+        Returns:
+            Dictionary containing response data and metadata
+        """
+        client, speaker, context_messages = self._prepare_turn(turn_number)
+        
+        # Get response from the model, passing the pre-encoded context to
+        # clients that can send it as-is
+        kwargs = {}
+        if client.accepts_encoded_messages:
+            kwargs['messages_json'] = self._build_context_json(speaker == "Model A")
+        result = await client.agenerate_response(
+            messages=context_messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens_per_turn,
+            seed=self.seed,
+            before_request=before_request,
+            **kwargs
+        )
+        
+        result = self._record_result(result, speaker, turn_number)
+        await self._aslide_window(before_request)
+        return result
+    
+    def get_conversation_transcript(self, since: int = 0) -> List[ConversationMessage]:
+        """
+        Get the conversation transcript.
+        
+        Pollers can pass the number of messages they already have to fetch
+        only the new ones instead of copying the whole history each time.
+        
+        Args:
+            since: Number of leading messages to skip (default: 0)
+        
+        Returns:
+            List of messages with speaker and content
+        """
+        return self.messages[since:]
+    
+    def run_marshaled(self, turns: int) -> List[Dict[str, any]]:
+        """
+        Generate the next turns with one request per batch of turns.
+        
+        Model A's client writes both sides of the dialogue in a single
+        response, which saves a round-trip per turn. Because one model voices
+        both personas, this suits evaluation runs rather than a real duel.
+        Batches are capped at a few turns, and a batch whose output can't be
+        split into turns is generated turn by turn instead.
+        
+        Args:
+            turns: Number of turns to generate
+        
+        Returns:
+            List of turn results, as returned by get_next_response; ends
+            early at the first failed turn
+        """
+        results = []
+        while len(results) < turns:
+            first_turn = len(self.messages) + 1
+            count = min(turns - len(results), _MARSHAL_MAX_TURNS)
+            
+            batch = self._generate_marshaled(first_turn, count)
+            if batch is None:
+                batch = []
+                for turn_number in range(first_turn, first_turn + count):
+                    batch.append(self.get_next_response(turn_number))
+                    if not batch[-1]['success']:
+                        break
+            
+            results.extend(batch)
+            if not batch[-1]['success']:
+                break
+        
+        return results
+    
+    def _generate_marshaled(self, first_turn: int, count: int) -> Optional[List[Dict[str, any]]]:
         """
-        Get the full conversation transcript.
+        Generate several turns with a single request.
         
         Returns:
-            List of message dictionaries with speaker and content
+            The recorded turn results, a single failed result if the request
+            failed, or None if the response couldn't be parsed
         """
-        return self.messages.copy()
+        first_speaker = "A" if first_turn % 2 == 1 else "B"
+        system_prompt = self.system_prompt_template.format(topic=self.discussion_topic)
+        context_messages = [
+            {
+                "role": "system",
+                "content": (
+                    f"Write the next {count} turns of a dialogue between two AI assistants, A and B, "
+                    f"about: {self.discussion_topic}\n\n"
+                    f"A's persona: {self.model_a_persona}\n\n"
+                    f"B's persona: {self.model_b_persona}\n\n"
+                    f"Both follow these instructions:\n{system_prompt}\n\n"
+                    f"Start each turn on a new line with \"A: \" or \"B: \", beginning with {first_speaker} "
+                    f"and alternating. Output only the dialogue."
+                )
+            }
+        ]
+        recent = self.messages[self._window_start:]
+        if recent:
+            history = "\n".join(f"{message.speaker.removeprefix('Model ')}: {message.content}" for message in recent)
+            if self._rolling_summary:
+                history = f"(Earlier: {self._rolling_summary})\n{history}"
+            context_messages.append({"role": "user", "content": f"Dialogue so far:\n{history}"})
+        else:
+            context_messages.append({"role": "user", "content": "Start the dialogue."})
+        
+        max_tokens = None
+        if self.max_tokens_per_turn is not None:
+            max_tokens = self.max_tokens_per_turn * count
+        
+        result = self.model_a_client.generate_response(
+            messages=context_messages,
+            temperature=self.temperature,
+            max_tokens=max_tokens,
+            seed=self.seed
+        )
+        if not result['success']:
+            return [self._record_result(result, "Model A" if first_speaker == "A" else "Model B", first_turn)]
+        
+        contents = _parse_marshaled_turns(result['content'], first_speaker, count)
+        if contents is None:
+            logger.debug("Could not parse marshaled turns %d-%d", first_turn, first_turn + count - 1)
+            return None
+        
+        # Token usage is only known for the whole batch, so it isn't split per turn
+        results = []
+        for turn_number, content in enumerate(contents, start=first_turn):
+            turn_result = {
+                'success': True,
+                'content': content,
+                'finish_reason': result['finish_reason'],
+                'usage': None,
+                'elapsed_time': result['elapsed_time'] / count,
+                'error': None,
+                'error_type': None
+            }
+            speaker = "Model A" if turn_number % 2 == 1 else "Model B"
+            results.append(self._record_result(turn_result, speaker, turn_number))
+        
+        self._slide_window()
+        return results
     
     def reset(self):
         """Reset the conversation to initial state."""
         self.messages = []
+        self._recorded_count = 0
+        self._window_start = 0
+        self._rolling_summary = None
+        self._reset_contexts()
 
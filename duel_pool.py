@@ -0,0 +1,88 @@
+"""
+Duel Pool Module
+Runs many independent conversations concurrently within provider limits.
+"""
+
+from conversation import ConversationOrchestrator
+from typing import Dict, List
+import asyncio
+import time
+
+
+class DuelPool:
+    """
+    Runs several duels at once, overlapping their network round-trips.
+    
+    Turns within a duel stay sequential. Across duels, the number of
+    in-flight requests is capped and request starts, retries included, are
+    spread out with a token bucket so the provider's requests-per-minute
+    limit is respected.
+    """
+    
+    def __init__(self, max_concurrency: int = 32, rpm: int = 500):
+        """
+        Initialize duel pool.
+        
+        Args:
+            max_concurrency: Maximum number of requests in flight at once
+            rpm: Maximum number of requests started per minute
+        """
+        self.max_concurrency = max_concurrency
+        self.rpm = rpm
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._bucket_lock = asyncio.Lock()
+        self._tokens = float(rpm)
+        self._last_refill = time.monotonic()
+    
+    async def _take_token(self):
+        """Wait until the rate limit allows another request to start."""
+        async with self._bucket_lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rpm, self._tokens + (now - self._last_refill) * self.rpm / 60)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * 60 / self.rpm)
+    
+    async def run_duel(self, orchestrator: ConversationOrchestrator, turns: int) -> List[Dict[str, any]]:
+        """
+        Run one conversation to completion.
+        
+        Args:
+            orchestrator: Conversation to advance
+            turns: Number of turns to generate
+        
+        Returns:
+            List of turn results; ends early at the first failed turn
+        """
+        results = []
+        for turn_number in range(1, turns + 1):
+            async with self._semaphore:
+                # Every attempt waits for a token, so retries after rate
+                # limiting don't bypass the bucket
+                result = await orchestrator.aget_next_response(turn_number, before_request=self._take_token)
+            
+            results.append(result)
+            if not result['success']:
+                break
+        
+        return results
+    
+    async def run_all(
+        self,
+        orchestrators: List[ConversationOrchestrator],
+        turns: int
+    ) -> List[List[Dict[str, any]]]:
+        """
+        Run several conversations concurrently.
+        
+        Args:
+            orchestrators: Conversations to advance
+            turns: Number of turns to generate in each
+        
+        Returns:
+            Turn results for each conversation, in the order given
+        """
+        return await asyncio.gather(*(self.run_duel(o, turns) for o in orchestrators))
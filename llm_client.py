@@ -3,20 +3,215 @@ LLM API Client Module
 Handles communication with LLM endpoints using OpenAI-compatible API format.
 """
 
-from openai import OpenAI
-from typing import List, Dict, Optional
+from functools import lru_cache
+from openai import AsyncOpenAI, OpenAI
+from response_cache import ResponseCache
+from typing import AsyncIterator, Awaitable, Callable, Iterator, List, Dict, Optional, Tuple
+import asyncio
+import httpx
+import openai
+import orjson
+import random
 import time
+import weakref
+
+
+# Shared connection pool so every turn reuses keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per request. HTTP/2 lets
+# requests to the same host multiplex over a single connection.
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=90)
+_HTTP_TIMEOUT = httpx.Timeout(120, connect=10)
+_http_client: Optional[httpx.Client] = None
+
+# Async callers may run many duels at once, so their pool is larger
+_ASYNC_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = weakref.WeakKeyDictionary()
+
+# Transient failures worth retrying with backoff; anything else (bad key,
+# malformed request, ...) fails immediately since retrying cannot help
+_RETRIABLE_ERROR_TYPES = frozenset({'rate_limit', 'timeout', 'connection', 'server_error'})
+
+
+def get_http_client() -> httpx.Client:
+    """Get the process-wide pooled HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    return _http_client
+
+
+def shutdown():
+    """Close the shared HTTP connection pool and drop clients built on it."""
+    global _http_client
+    get_openai_client.cache_clear()
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+
+
+async def ashutdown():
+    """Close the running event loop's async HTTP connection pool."""
+    loop_clients = _async_clients.pop(asyncio.get_running_loop(), None)
+    if loop_clients is not None:
+        await loop_clients['http'].aclose()
+
+
+@lru_cache(maxsize=16)
+def get_openai_client(api_key: str, base_url: Optional[str] = None) -> OpenAI:
+    """
+    Get an OpenAI client shared by every LLMClient talking to the same endpoint.
+    
+    Model A and Model B on one provider therefore send their turns through
+    a single SDK client and its connections, whichever model each uses.
+    """
+    if base_url:
+        return OpenAI(api_key=api_key, base_url=base_url, http_client=get_http_client(), max_retries=0)
+    return OpenAI(api_key=api_key, http_client=get_http_client(), max_retries=0)
+
+
+def get_async_openai_client(api_key: str, base_url: Optional[str] = None) -> AsyncOpenAI:
+    """
+    Get an AsyncOpenAI client for the running event loop.
+    
+    Async connections belong to the loop that opened them, so clients and
+    their connection pool are shared per endpoint within each loop.
+    """
+    loop = asyncio.get_running_loop()
+    loop_clients = _async_clients.get(loop)
+    if loop_clients is None:
+        loop_clients = {
+            'http': httpx.AsyncClient(http2=True, limits=_ASYNC_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
+            'openai': {}
+        }
+        _async_clients[loop] = loop_clients
+    
+    key = (api_key, base_url)
+    if key not in loop_clients['openai']:
+        if base_url:
+            client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=loop_clients['http'], max_retries=0)
+        else:
+            client = AsyncOpenAI(api_key=api_key, http_client=loop_clients['http'], max_retries=0)
+        loop_clients['openai'][key] = client
+    return loop_clients['openai'][key]
+
+
+def _parse_response(response, elapsed_time: float) -> Dict[str, any]:
+    """Build a result dictionary from a chat completion response."""
+    # Extract response content
+    content = response.choices[0].message.content
+    finish_reason = response.choices[0].finish_reason
+    
+    return {
+        'success': True,
+        'content': content,
+        'finish_reason': finish_reason,
+        'usage': _parse_usage(getattr(response, 'usage', None)),
+        'elapsed_time': elapsed_time,
+        'error': None,
+        'error_type': None
+    }
+
+
+def _parse_usage(usage) -> Optional[Dict[str, int]]:
+    """Convert a response's token usage to a dictionary, if it was reported."""
+    if not usage:
+        return None
+    
+    return {
+        'prompt_tokens': usage.prompt_tokens,
+        'completion_tokens': usage.completion_tokens,
+        'total_tokens': usage.total_tokens
+    }
+
+
+def _error_result(error: str, error_type: str = 'unknown') -> Dict[str, any]:
+    """Build a result dictionary for a failed request."""
+    return {
+        'success': False,
+        'content': None,
+        'finish_reason': None,
+        'usage': None,
+        'elapsed_time': None,
+        'error': error,
+        'error_type': error_type
+    }
+
+
+def _classify_error(error: Exception) -> str:
+    """Map an exception raised by a request to a result error_type."""
+    if isinstance(error, openai.RateLimitError):
+        return 'rate_limit'
+    if isinstance(error, (openai.APITimeoutError, asyncio.TimeoutError)):
+        return 'timeout'
+    if isinstance(error, openai.APIConnectionError):
+        return 'connection'
+    if isinstance(error, (openai.AuthenticationError, openai.PermissionDeniedError)):
+        return 'auth'
+    if isinstance(error, openai.BadRequestError):
+        return 'bad_request'
+    if isinstance(error, openai.InternalServerError):
+        return 'server_error'
+    if isinstance(error, openai.APIStatusError):
+        return 'api_error'
+    return 'unknown'
+
+
+def _classify_status(status: int) -> str:
+    """Map a non-200 HTTP status to a result error_type."""
+    if status == 429:
+        return 'rate_limit'
+    if status == 408:
+        return 'timeout'
+    if status in (401, 403):
+        return 'auth'
+    if status == 400:
+        return 'bad_request'
+    if status >= 500:
+        return 'server_error'
+    return 'api_error'
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number attempt + 1: exponential with jitter."""
+    return min(2 ** attempt, 30) + random.random()
+
+
+def _sleep_unless_stopped(delay: float, should_stop: Optional[Callable[[], bool]]) -> bool:
+    """
+    Sleep for delay seconds, waking early if should_stop starts returning True.
+    
+    Returns:
+        True if the sleep was cut short by a stop request
+    """
+    if should_stop is None:
+        time.sleep(delay)
+        return False
+    
+    deadline = time.monotonic() + delay
+    while not should_stop():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(0.1, remaining))
+    return True
 
 
 class LLMClient:
     """Client for interacting with LLM APIs."""
     
+    __slots__ = ("api_key", "base_url", "model", "timeout", "response_cache", "max_retries", "client")
+    
+    # Whether agenerate_response takes a pre-encoded messages_json argument
+    accepts_encoded_messages = False
+    
     def __init__(
         self,
         api_key: str,
         base_url: Optional[str] = None,
         model: str = "gpt-4.1-mini",
-        timeout: int = 60
+        timeout: int = 60,
+        response_cache: Optional[ResponseCache] = None,
+        max_retries: int = 5
     ):
         """
         Initialize LLM client.
@@ -26,21 +221,116 @@ class LLMClient:
             base_url: Base URL for the API endpoint (optional)
             model: Model name to use
             timeout: Request timeout in seconds
+            response_cache: Cache for deterministic (temperature 0 or seeded) responses
+            max_retries: Retries for rate-limited, timed-out or failed connections
         """
+        self.api_key = api_key
+        self.base_url = base_url
         self.model = model
         self.timeout = timeout
+        self.response_cache = response_cache
+        self.max_retries = max_retries
         
-        # Initialize OpenAI client
-        if base_url:
-            self.client = OpenAI(api_key=api_key, base_url=base_url)
-        else:
-            self.client = OpenAI(api_key=api_key)
+        # Initialize OpenAI client on top of the shared connection pool
+        self.client = get_openai_client(api_key, base_url)
+    
+    def close(self):
+        """
+        Release this client.
+        
+        Connections belong to the shared pool, so there is nothing to close
+        per client; use the module-level shutdown() to close the pool.
+        """
+    
+    def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Stream a response from the LLM as it is generated.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum tokens to generate (optional)
+            seed: Sampling seed for reproducible output (optional)
+        
+        Yields:
+            Content deltas in the order they arrive
+        """
+        for chunk in self._stream_chunks(messages, temperature, max_tokens, seed):
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+    
+    def _stream_chunks(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        seed: Optional[int]
+    ) -> Iterator:
+        """Start a streamed completion whose last chunk reports token usage."""
+        return self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=self.timeout,
+            seed=seed,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+    
+    async def astream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from the LLM without blocking the event loop.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum tokens to generate (optional)
+            seed: Sampling seed for reproducible output (optional)
+        
+        Yields:
+            Content deltas in the order they arrive
+        """
+        client = get_async_openai_client(self.api_key, self.base_url)
+        stream = await client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=self.timeout,
+            seed=seed,
+            stream=True
+        )
+        
+        async for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
     
     def generate_response(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        seed: Optional[int] = None,
+        cache: bool = False
     ) -> Dict[str, any]:
         """
         Generate a response from the LLM.
@@ -49,55 +339,209 @@ class LLMClient:
             messages: List of message dictionaries with 'role' and 'content'
             temperature: Sampling temperature (0.0 to 2.0)
             max_tokens: Maximum tokens to generate (optional)
+            on_chunk: Callback receiving content deltas; enables streaming (optional)
+            should_stop: Polled after each streamed delta to abort early (optional)
+            seed: Sampling seed for reproducible output (optional)
+            cache: Also cache sampled (non-deterministic) responses, in memory
+                if the client has no response cache
         
         Returns:
             Dictionary containing response data and metadata
         """
-        try:
-            start_time = time.time()
-            
-            # Make API call
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                timeout=self.timeout
-            )
-            
-            elapsed_time = time.time() - start_time
+        cache_key, cached = self._cache_lookup(messages, temperature, max_tokens, seed, cache)
+        if cached is not None:
+            if on_chunk is not None:
+                on_chunk(cached['content'])
+            return cached
+        
+        result = self._generate(messages, temperature, max_tokens, on_chunk, should_stop, seed)
+        
+        if cache_key is not None and result['success']:
+            self.response_cache.persist(cache_key, result)
+        
+        return result
+    
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        seed: Optional[int] = None,
+        cache: bool = False,
+        before_request: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> Dict[str, any]:
+        """
+        Generate a response from the LLM without blocking the event loop.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum tokens to generate (optional)
+            seed: Sampling seed for reproducible output (optional)
+            cache: Also cache sampled (non-deterministic) responses, in memory
+                if the client has no response cache
+            before_request: Awaited before the request and every retry, e.g.
+                to wait for a rate limiter (optional)
+        
+        Returns:
+            Dictionary containing response data and metadata
+        """
+        cache_key, cached = self._cache_lookup(messages, temperature, max_tokens, seed, cache)
+        if cached is not None:
+            return cached
+        
+        client = get_async_openai_client(self.api_key, self.base_url)
+        for attempt in range(self.max_retries + 1):
+            if before_request is not None:
+                await before_request()
+            try:
+                start_time = time.time()
+                
+                # Make API call
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout,
+                    seed=seed
+                )
+                
+                result = _parse_response(response, time.time() - start_time)
+                break
+            except Exception as e:
+                error_type = _classify_error(e)
+                if error_type not in _RETRIABLE_ERROR_TYPES or attempt == self.max_retries:
+                    return _error_result(str(e), error_type)
             
-            # Extract response content
-            content = response.choices[0].message.content
-            finish_reason = response.choices[0].finish_reason
+            await asyncio.sleep(_backoff_delay(attempt))
+        
+        if cache_key is not None:
+            self.response_cache.persist(cache_key, result)
+        
+        return result
+    
+    def _cache_lookup(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        seed: Optional[int],
+        cache: bool = False
+    ) -> Tuple[Optional[str], Optional[Dict[str, any]]]:
+        """
+        Look up a request in the response cache.
+        
+        Returns:
+            Tuple of (cache_key, cached_result); the key is None when the
+            request is not cacheable
+        """
+        # Unless the caller opts in, only deterministic requests are cached
+        # so sampling stays random otherwise
+        if not cache and (self.response_cache is None or (temperature != 0 and seed is None)):
+            return None, None
+        
+        # Opting in without a configured cache keeps responses in memory
+        if self.response_cache is None:
+            self.response_cache = ResponseCache(directory=None)
+        cache_key = ResponseCache.make_key(self.model, messages, temperature, seed, max_tokens, self.base_url)
+        return cache_key, self.response_cache.resume(cache_key)
+    
+    def _generate(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        on_chunk: Optional[Callable[[str], None]],
+        should_stop: Optional[Callable[[], bool]],
+        seed: Optional[int],
+        max_retries: Optional[int] = None
+    ) -> Dict[str, any]:
+        """Call the API, streaming when on_chunk is given and retrying transient failures."""
+        if max_retries is None:
+            max_retries = self.max_retries
+        
+        # A stream that fails part-way is not retried, since its deltas
+        # have already been forwarded
+        streamed = False
+        
+        def forward(delta: str):
+            nonlocal streamed
+            streamed = True
+            on_chunk(delta)
+        
+        for attempt in range(max_retries + 1):
+            try:
+                start_time = time.time()
+                
+                if on_chunk is not None:
+                    return self._generate_streamed(
+                        messages, temperature, max_tokens, forward, should_stop, seed, start_time
+                    )
+                
+                # Make API call
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout,
+                    seed=seed
+                )
+                
+                return _parse_response(response, time.time() - start_time)
             
-            # Extract token usage if available
-            usage = None
-            if hasattr(response, 'usage') and response.usage:
-                usage = {
-                    'prompt_tokens': response.usage.prompt_tokens,
-                    'completion_tokens': response.usage.completion_tokens,
-                    'total_tokens': response.usage.total_tokens
-                }
+            except Exception as e:
+                error_type = _classify_error(e)
+                if (error_type not in _RETRIABLE_ERROR_TYPES or attempt == max_retries or streamed
+                        or (should_stop is not None and should_stop())):
+                    return _error_result(str(e), error_type)
             
-            return {
-                'success': True,
-                'content': content,
-                'finish_reason': finish_reason,
-                'usage': usage,
-                'elapsed_time': elapsed_time,
-                'error': None
-            }
+            # Stop may be requested during the backoff (the app sets it when a
+            # Stop click discards the pending turn), so check it as we wait
+            if _sleep_unless_stopped(_backoff_delay(attempt), should_stop):
+                return _error_result('Generation stopped', 'stopped')
+    
+    def _generate_streamed(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        on_chunk: Callable[[str], None],
+        should_stop: Optional[Callable[[], bool]],
+        seed: Optional[int],
+        start_time: float
+    ) -> Dict[str, any]:
+        """Consume a streamed response, forwarding each delta to on_chunk."""
+        parts = []
+        finish_reason = None
+        usage = None
+        for chunk in self._stream_chunks(messages, temperature, max_tokens, seed):
+            # Usage arrives in a final chunk with no choices
+            if getattr(chunk, 'usage', None):
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
             
-        except Exception as e:
-            return {
-                'success': False,
-                'content': None,
-                'finish_reason': None,
-                'usage': None,
-                'elapsed_time': None,
-                'error': str(e)
-            }
+            choice = chunk.choices[0]
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+            delta = choice.delta.content
+            if delta:
+                parts.append(delta)
+                on_chunk(delta)
+                if should_stop is not None and should_stop():
+                    return _error_result('Generation stopped', 'stopped')
+        
+        return {
+            'success': True,
+            'content': "".join(parts),
+            'finish_reason': finish_reason,
+            'usage': _parse_usage(usage),
+            'elapsed_time': time.time() - start_time,
+            'error': None,
+            'error_type': None
+        }
     
     def test_connection(self) -> Dict[str, any]:
         """
@@ -112,13 +556,173 @@ class LLMClient:
                 {"role": "user", "content": "Hello"}
             ]
             
-            result = self.generate_response(test_messages, max_tokens=10)
+            # Report failures straight away rather than retrying them
+            result = self._generate(test_messages, 0.7, 10, None, None, None, max_retries=0)
             
             if result['success']:
                 return {'success': True, 'error': None}
             else:
                 return {'success': False, 'error': result['error']}
-                
+        
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
+
+class FastLLMClient(LLMClient):
+    """
+    LLM client whose async path posts to the chat completions endpoint with aiohttp.
+    
+    Intended for batch evaluations that fan out many concurrent requests,
+    where the OpenAI SDK's transport becomes the bottleneck. Synchronous and
+    streaming calls fall back to the regular LLMClient implementation.
+    The session is bound to one event loop; call aclose() when done.
+    """
+    
+    __slots__ = ("_endpoint", "_session")
+    
+    accepts_encoded_messages = True
+    
+    DEFAULT_BASE_URL = "https://api.openai.com/v1"
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        model: str = "gpt-4.1-mini",
+        timeout: int = 60,
+        response_cache: Optional[ResponseCache] = None,
+        max_retries: int = 5
+    ):
+        """
+        Initialize fast LLM client.
+        
+        Args:
+            api_key: API key for authentication
+            base_url: Base URL for the API endpoint (optional)
+            model: Model name to use
+            timeout: Request timeout in seconds
+            response_cache: Cache for deterministic (temperature 0 or seeded) responses
+            max_retries: Retries for rate-limited, timed-out or failed connections
+        """
+        super().__init__(api_key, base_url, model, timeout, response_cache, max_retries)
+        self._endpoint = f"{(base_url or self.DEFAULT_BASE_URL).rstrip('/')}/chat/completions"
+        self._session = None
+    
+    def _get_session(self):
+        """Get the aiohttp session, creating it inside the running event loop."""
+        # Imported lazily so aiohttp is only needed by callers of this client
+        import aiohttp
+        
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=200, ttl_dns_cache=300),
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+    
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        seed: Optional[int] = None,
+        cache: bool = False,
+        messages_json: Optional[bytes] = None,
+        before_request: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> Dict[str, any]:
+        """
+        Generate a response by posting directly to the chat completions endpoint.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum tokens to generate (optional)
+            seed: Sampling seed for reproducible output (optional)
+            cache: Also cache sampled (non-deterministic) responses, in memory
+                if the client has no response cache
+            messages_json: Messages already encoded as JSON, sent as-is instead
+                of encoding them again (optional)
+            before_request: Awaited before the request and every retry, e.g.
+                to wait for a rate limiter (optional)
+        
+        Returns:
+            Dictionary containing response data and metadata
+        """
+        cache_key, cached = self._cache_lookup(messages, temperature, max_tokens, seed, cache)
+        if cached is not None:
+            return cached
+        
+        params = {"model": self.model, "temperature": temperature}
+        if max_tokens is not None:
+            params["max_tokens"] = max_tokens
+        if seed is not None:
+            params["seed"] = seed
+        
+        # Splice the messages into the encoded parameters so a long,
+        # pre-encoded history is copied rather than serialized again
+        if messages_json is None:
+            messages_json = orjson.dumps(messages)
+        body = orjson.dumps(params)[:-1] + b',"messages":' + messages_json + b"}"
+        
+        # Imported lazily so aiohttp is only needed by callers of this client
+        import aiohttp
+        
+        for attempt in range(self.max_retries + 1):
+            if before_request is not None:
+                await before_request()
+            try:
+                start_time = time.time()
+                
+                async with self._get_session().post(
+                    self._endpoint, data=body, headers={"Content-Type": "application/json"}
+                ) as response:
+                    if response.status == 200:
+                        # Decode the raw body directly, skipping aiohttp's
+                        # content-type check and stdlib json
+                        data = orjson.loads(await response.read())
+                        break
+                    error = f"HTTP {response.status}: {await response.text()}"
+                    error_type = _classify_status(response.status)
+            except aiohttp.ClientConnectionError as e:
+                error, error_type = str(e), 'connection'
+            except Exception as e:
+                error, error_type = str(e), _classify_error(e)
+            
+            if error_type not in _RETRIABLE_ERROR_TYPES or attempt == self.max_retries:
+                return _error_result(error, error_type)
+            await asyncio.sleep(_backoff_delay(attempt))
+        
+        try:
+            elapsed_time = time.time() - start_time
+            
+            choice = data["choices"][0]
+            usage = data.get("usage")
+            if usage:
+                usage = {
+                    'prompt_tokens': usage.get('prompt_tokens'),
+                    'completion_tokens': usage.get('completion_tokens'),
+                    'total_tokens': usage.get('total_tokens')
+                }
+            
+            result = {
+                'success': True,
+                'content': choice["message"]["content"],
+                'finish_reason': choice.get("finish_reason"),
+                'usage': usage,
+                'elapsed_time': elapsed_time,
+                'error': None,
+                'error_type': None
+            }
+        except Exception as e:
+            return _error_result(str(e))
+        
+        if cache_key is not None:
+            self.response_cache.persist(cache_key, result)
+        
+        return result
+    
+    async def aclose(self):
+        """Close the aiohttp session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,120 @@
+"""
+Response Cache Module
+Disk-backed cache of LLM responses for replaying identical prompts.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import hashlib
+import json
+import orjson
+import os
+import tempfile
+import threading
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "llmduel")
+
+
+class ResponseCache:
+    """
+    Stores successful responses keyed by a hash of the request.
+    
+    Recently used responses are also kept in memory so replays within a
+    process skip the disk read as well as the network round-trip.
+    """
+    
+    def __init__(self, directory: Optional[str] = DEFAULT_CACHE_DIR, max_memory_entries: int = 256):
+        """
+        Initialize response cache.
+        
+        Args:
+            directory: Directory where cached responses are stored (None to
+                keep them in memory only)
+            max_memory_entries: Number of responses kept in memory
+        """
+        self.directory = directory
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, Dict[str, any]]" = OrderedDict()
+        # One cache may be shared by clients generating on several threads
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        seed: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        base_url: Optional[str] = None
+    ) -> str:
+        """Build a stable cache key for a chat completion request."""
+        # The endpoint is part of the key since different servers may
+        # serve different models under the same name
+        payload = {
+            'base_url': base_url,
+            'model': model,
+            'temperature': temperature,
+            'seed': seed,
+            'max_tokens': max_tokens,
+            'messages': messages
+        }
+        return hashlib.blake2b(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+    
+    def _remember(self, key: str, result: Dict[str, any]):
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+    
+    def resume(self, key: str) -> Optional[Dict[str, any]]:
+        """
+        Look up a cached response.
+        
+        Returns:
+            A copy of the cached result dictionary, or None on a miss
+        """
+        with self._lock:
+            result = self._memory.get(key)
+        if result is None:
+            if self.directory is None:
+                return None
+            try:
+                with open(self._path(key), 'r', encoding='utf-8') as f:
+                    result = json.load(f)
+            except (OSError, ValueError):
+                return None
+        self._remember(key, result)
+        # Callers annotate results in place, so never hand out the cached dict
+        return dict(result)
+    
+    def persist(self, key: str, result: Dict[str, any]):
+        """Store a response, ignoring failures to write the cache."""
+        self._remember(key, dict(result))
+        if self.directory is None:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"Warning: Could not write response cache: {e}")
+    
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._memory.clear()
+        if self.directory is None or not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass